@@ -1,6 +1,9 @@
 import numpy as np
 import pandas as pd
 
+from numba import njit, prange, types
+from numba.typed import Dict
+
 from ..utils.utils import set_data_columns, spec_updater
 
 import warnings
@@ -62,6 +65,13 @@ class Epithelium:
 
     '''
 
+    # slots for the attributes accessed at each step, `__dict__` is
+    # kept for the extra indices and the subclasses attributes
+    __slots__ = ('identifier', 'coords', 'dcoords', 'ncoords', 'dim',
+                 'datasets', 'data_names', 'element_names', 'specs',
+                 'bbox', '_has_cell', '_edge_col_cache',
+                 '_lvl_codes_cache', '_edge_mindex_cache', '__dict__')
+
     def __init__(self, identifier, datasets,
                  specs=None, coords=None):
         '''
@@ -104,6 +114,7 @@ class Epithelium:
         # for name, data in datasets.items():
         #     setattr(self, '{}_df'.format(name), data)
         self.data_names = list(datasets.keys())
+        self._has_cell = 'cell' in self.data_names
         self.element_names = ['srce', 'trgt',
                               'face', 'cell'][:len(self.data_names)]
         if specs is None:
@@ -112,9 +123,12 @@ class Epithelium:
             specs['settings'] = {}
 
         self.specs = specs
+        # topology dependant arrays, computed lazily
+        # and cleared by `self._reset_topo_cache`
+        self._edge_col_cache = {}
+        self._lvl_codes_cache = {}
+        self._edge_mindex_cache = None
         self.update_specs(specs, reset=False)
-        self.edge_mindex = pd.MultiIndex.from_arrays(self.edge_idx.values.T,
-                                                     names=self.element_names)
         # # Topology (geometry independant)
         self.reset_topo()
         self.bbox = None
@@ -135,6 +149,7 @@ class Epithelium:
     @edge_df.setter
     def edge_df(self, value):
         self.datasets['edge'] = value
+        self._reset_topo_cache()
 
     @property
     def cell_df(self):
@@ -204,26 +219,70 @@ class Epithelium:
 
         spec_updater(self.specs, new)
         set_data_columns(self.datasets, new, reset)
+        self._reset_topo_cache()
 
     def update_num_sides(self):
         self.face_df['num_sides'] = self.edge_df.face.value_counts().loc[
             self.face_df.index]
 
     def update_num_faces(self):
-        self.cell_df['num_faces'] = self.edge_df.groupby('cell').apply(
-            lambda df: df['face'].unique().size)
+        cell_codes, cell_idx = self._lvl_codes('cell')
+        face_codes, face_idx = self._lvl_codes('face')
+        has_lvl = (cell_codes >= 0) & (face_codes >= 0)
+        # unique (cell, face) pairs
+        cell_faces = pd.unique(
+            cell_codes[has_lvl].astype(np.int64) * face_idx.size +
+            face_codes[has_lvl])
+        num_faces = np.bincount(cell_faces // max(face_idx.size, 1),
+                                minlength=cell_idx.size)
+        self.cell_df['num_faces'] = pd.Series(num_faces, index=cell_idx)
+
+    @property
+    def edge_mindex(self):
+        """`pd.MultiIndex` over the edges' element indices,
+        built at first access after a topology change.
+        """
+        if self._edge_mindex_cache is None:
+            self._edge_mindex_cache = pd.MultiIndex.from_arrays(
+                [self._edge_col(name) for name in self.element_names],
+                names=self.element_names)
+        return self._edge_mindex_cache
 
     def update_mindex(self):
-        self.edge_mindex = pd.MultiIndex.from_arrays(self.edge_idx.values.T,
-                                                     names=self.element_names)
+        self._edge_mindex_cache = None
+
+    def _reset_topo_cache(self):
+        """Clears the arrays derived from the edges' topology columns,
+        they will be recomputed at their next use.
+        """
+        self._edge_col_cache = {}
+        self._lvl_codes_cache = {}
+        self._edge_mindex_cache = None
+
+    def _edge_col(self, name):
+        """Returns the values of the `name` column of `self.edge_df` as
+        a read-only array.
+
+        For the topology columns (self.element_names), the array
+        is cached until the next `reset_topo`. This is only used by the
+        per step sums (`sum_face`, ...) and `edge_mindex`, the public
+        topology queries (`get_valid`, `cut_out`, ...) read the live
+        columns, as those are often edited in place.
+        """
+        if name not in self.element_names:
+            return self.edge_df[name].to_numpy()
+        if name not in self._edge_col_cache:
+            values = self.edge_df[name].to_numpy()
+            values.flags.writeable = False
+            self._edge_col_cache[name] = values
+        return self._edge_col_cache[name]
 
     def reset_topo(self):
+        self._reset_topo_cache()
         self.update_num_sides()
-        self.update_mindex()
-        if 'cell' in self.data_names:
+        if self._has_cell:
             self.update_num_faces()
-        if ('opposite' in self.edge_df.columns) and (
-                'cell' not in self.data_names):
+        if ('opposite' in self.edge_df.columns) and not self._has_cell:
             try:
                 self.edge_df['opposite'] = get_opposite(self.edge_df)
             except ValueError:
@@ -249,7 +308,7 @@ class Epithelium:
 
     @property
     def Nc(self):
-        if 'cell' in self.data_names:
+        if self._has_cell:
             return self.cell_df.shape[0]
         elif 'face' in self.data_names:
             return self.face_df.shape[0]
@@ -282,18 +341,55 @@ class Epithelium:
     def e_cell_idx(self):
         return self.edge_df['cell']
 
+    @property
+    def _vert_xyz(self):
+        """(Nv, dim) array of the vertices' `self.coords` positions.
+
+        This is not cached, as the positions are updated in place
+        at each geometry or solver step.
+        """
+        return self.vert_df[self.coords].to_numpy()
+
     @property
     def edge_idx_array(self):
-        return np.vstack((self.e_srce_idx,
-                          self.e_trgt_idx,
-                          self.e_face_idx)).T
+        """(Ne, 3) array of the edges' srce, trgt and face indices
+        """
+        return self.edge_df[['srce', 'trgt', 'face']].to_numpy()
 
     def _upcast(self, idx, df):
 
+        pos = np.asarray(idx)
+        if (pos.dtype.kind in 'iu' and pos.size and
+                _is_positional(df.index) and
+                (pos.min() >= 0) and (pos.max() < df.shape[0])):
+            return self._positional_upcast(pos, df)
         upcast = df.loc[idx]
         upcast.index = self.edge_df.index
         return upcast
 
+    def _positional_upcast(self, pos, df):
+        """Upcasts `df` when its index labels are also the
+        positions of its rows, by indexing the underlying array
+        instead of going through `df.loc`
+        """
+        if isinstance(df, pd.Series):
+            dtypes = [df.dtype]
+        else:
+            dtypes = df.dtypes.unique()
+        # extension dtypes (categorical, nullable...) would be
+        # lost through `to_numpy`
+        if (len(dtypes) != 1) or not isinstance(dtypes[0], np.dtype):
+            upcast = df.take(pos)
+            upcast.index = self.edge_df.index
+            return upcast
+        if isinstance(df, pd.Series):
+            return pd.Series(df.to_numpy()[pos],
+                             index=self.edge_df.index,
+                             name=df.name)
+        return pd.DataFrame(df.to_numpy()[pos],
+                            index=self.edge_df.index,
+                            columns=df.columns)
+
     def upcast_cols(self, element, columns):
         """Syntactic sugar to upcast from the
         epithelium datasets.
@@ -339,10 +435,53 @@ class Epithelium:
         '''
         return self._upcast(self.edge_df['cell'], df)
 
+    def _lvl_codes(self, lvl, live=False):
+        """Returns the integer codes of the `lvl` column of `self.edge_df`
+        and the corresponding sorted index of `lvl` elements.
+        Edges with a NaN `lvl` have a code of -1.
+
+        Those are cached until the next topology change, unless `live`
+        is True, in which case they are computed from the current
+        `lvl` column and not stored.
+        """
+        if live:
+            return _factorize_lvl(self.edge_df[lvl].to_numpy(), lvl)
+        if lvl not in self._lvl_codes_cache:
+            self._lvl_codes_cache[lvl] = _factorize_lvl(
+                self._edge_col(lvl), lvl)
+        return self._lvl_codes_cache[lvl]
+
     def _lvl_sum(self, df, lvl):
-        df_ = df.copy()
-        df_.index = self.edge_mindex
-        return df_.sum(level=lvl)
+        codes, lvl_idx = self._lvl_codes(lvl)
+        if len(df) != codes.size:
+            raise ValueError(
+                'Length mismatch: {} rows to sum over {} edges, '
+                'call `reset_topo` after adding or removing '
+                'edges'.format(len(df), codes.size))
+        if isinstance(df, pd.Series):
+            dtypes = [df.dtype]
+        else:
+            dtypes = df.dtypes.unique()
+        if ((len(dtypes) != 1) or not isinstance(dtypes[0], np.dtype) or
+                (dtypes[0].kind not in 'biuf')):
+            # NaN labels (code -1) are dropped, as with `sum(level=)`
+            has_lvl = codes >= 0
+            summed = df[has_lvl].groupby(codes[has_lvl]).sum(
+                numeric_only=False)
+            summed.index = lvl_idx[summed.index]
+            return summed
+
+        values = df.to_numpy()
+        if values.dtype.kind == 'b':
+            values = values.astype(np.int64)
+        if isinstance(df, pd.Series):
+            summed = np.zeros((lvl_idx.size, 1), dtype=values.dtype)
+            _lvl_sum_nb(codes, values.reshape((-1, 1)), summed)
+            return pd.Series(summed[:, 0], index=lvl_idx, name=df.name)
+        summed = np.zeros((lvl_idx.size, values.shape[1]),
+                          dtype=values.dtype)
+        _lvl_sum_nb(codes, values, summed)
+        return pd.DataFrame(summed, index=lvl_idx, columns=df.columns)
 
     def sum_srce(self, df):
         return self._lvl_sum(df, 'srce')
@@ -385,22 +524,52 @@ class Epithelium:
             lambda df: df[periph])
         return orbits
 
+    def _ordered_face_srces(self):
+        """Chains the edges of each face, such that each edge's target
+        is the source of the next one.
+
+        Returns
+        -------
+        face_idx: `pd.Index`
+            the sorted face indices
+        face_offsets: (Nf+1,) int64 array
+            the ordered vertices of the ith face are
+            `srces[face_offsets[i]:face_offsets[i+1]]`
+        srces: int64 array
+            the source vertices of the edges, ordered face by face
+            (edges with a NaN face are omitted)
+        is_closed: (Nf,) bool array
+            False for the faces whose edges could not be chained
+        """
+        face_codes, face_idx = self._lvl_codes('face', live=True)
+        # stable sort so that each face starts with its first edge,
+        # edges with a NaN face are left out
+        srces, trgts, face_offsets = self._lvl_groups(face_codes,
+                                                      face_idx.size)
+        ordered = np.empty(srces.size, dtype=np.int64)
+        is_closed = _ordered_edges_nb(srces, trgts, face_offsets, ordered)
+        return face_idx, face_offsets, srces[ordered], is_closed
+
     def face_polygons(self, coords):
-        def _get_verts_pos(face):
-            try:
-                edges = _ordered_edges(face)
-            except IndexError:
-                #- BC -#
-                # I'm still trying to figure
-                # out a way to raise this exception
-                # with altered datasets but to no avail
-                # Leaving it included in coverage.
-                log.warning('Face is not closed')
-                return np.nan
-            return np.array([self.vert_df.loc[idx[0], coords]
-                             for idx in edges])
-        polys = self.edge_df.groupby('face').apply(_get_verts_pos).dropna()
-        return polys
+        """Returns a `pd.Series` indexed by face, holding for each face
+        the (num_sides, len(coords)) array of its ordered vertices
+        positions. Faces which are not closed are omitted.
+        """
+        face_idx, face_offsets, srces, is_closed = self._ordered_face_srces()
+        if not is_closed.all():
+            #- BC -#
+            # I'm still trying to figure
+            # out a way to raise this exception
+            # with altered datasets but to no avail
+            # Leaving it included in coverage.
+            log.warning('Face is not closed')
+
+        srces = _vert_positions(self.vert_df.index, srces)
+        # a single gather for all the faces, split in per face views
+        verts = self.vert_df[coords].to_numpy()[srces]
+        polys = pd.Series(np.split(verts, face_offsets[1:-1]),
+                          index=face_idx)
+        return polys[is_closed]
 
     def get_extra_indices(self):
         """Computes extra indices:
@@ -450,16 +619,19 @@ class Epithelium:
         if 'opposite' not in self.edge_df.columns:
             self.edge_df['opposite'] = get_opposite(self.edge_df)
 
-        self.dble_edges = self.edge_df[self.edge_df['opposite'] >= 0].index
-        theta = np.arctan2(self.edge_df.loc[self.dble_edges, 'dy'],
-                           self.edge_df.loc[self.dble_edges, 'dx'])
+        opposite = self.edge_df['opposite'].to_numpy()
+        is_dble = opposite >= 0
+        self.dble_edges = self.edge_df.index[is_dble]
+        # same partition as 0 <= arctan2(dy, dx) < pi, without the arctan2
+        dx = self.edge_df['dx'].to_numpy()[is_dble]
+        dy = self.edge_df['dy'].to_numpy()[is_dble]
+        is_east = (dy > 0) | ((dy == 0) & (dx >= 0))
 
-        self.east_edges = self.edge_df.loc[self.dble_edges][
-            (theta >= 0) & (theta < np.pi)].index
-        self.west_edges = pd.Index(self.edge_df.loc[
-            self.east_edges, 'opposite'].astype(np.int), name='edge')
+        self.east_edges = self.dble_edges[is_east]
+        self.west_edges = pd.Index(opposite[is_dble][is_east].astype(int),
+                                   name='edge')
 
-        self.free_edges = self.edge_df[self.edge_df['opposite'] == -1].index
+        self.free_edges = self.edge_df.index[opposite == -1]
         self.sgle_edges = self.free_edges.append(self.east_edges)
         self.srtd_edges = self.sgle_edges.append(self.west_edges)
 
@@ -508,27 +680,70 @@ class Epithelium:
         self.reset_topo()
         self.get_extra_indices()
 
+    def _lvl_groups(self, codes, num_lvl):
+        """Returns the edges' `srce` and `trgt` arrays sorted by their
+        level `codes`, and the (num_lvl+1,) offsets such that the edges
+        of the ith element span `offsets[i]:offsets[i+1]`.
+        """
+        # edges with a NaN level (code -1) are left out
+        has_lvl = np.flatnonzero(codes >= 0)
+        lvl_sort = has_lvl[np.argsort(codes[has_lvl], kind='mergesort')]
+        offsets = np.zeros(num_lvl + 1, dtype=np.int64)
+        offsets[1:] = np.cumsum(np.bincount(codes[has_lvl],
+                                            minlength=num_lvl))
+        srces = self.edge_df['srce'].to_numpy().astype(np.int64)[lvl_sort]
+        trgts = self.edge_df['trgt'].to_numpy().astype(np.int64)[lvl_sort]
+        return srces, trgts, offsets
+
+    def _valid_faces(self, face_codes, num_faces):
+        """Returns a bool array over the (sorted) faces, True iff the
+        face's sources and targets sets are the same
+        """
+        return _valid_faces_nb(*self._lvl_groups(face_codes, num_faces))
+
+    def _closed_cells(self, codes, num_cells):
+        """Returns a bool array over the (sorted) cells, True iff each
+        edge of the cell has exactly one opposite edge in the cell
+        """
+        srces = self.edge_df['srce'].to_numpy()
+        trgts = self.edge_df['trgt'].to_numpy()
+        # (cell, srce, trgt) triples, hashed by pandas without
+        # packing them in a single (overflow prone) integer
+        pairs = pd.MultiIndex.from_arrays([codes, srces, trgts])
+        flipped = pd.MultiIndex.from_arrays([codes, trgts, srces])
+        # a repeated pair means its opposite is found twice
+        has_opposite = (flipped.isin(pairs) &
+                        ~pairs.duplicated(keep=False))
+        has_lvl = codes >= 0
+        num_edges = np.bincount(codes[has_lvl], minlength=num_cells)
+        num_opposites = np.bincount(codes[has_lvl],
+                                    weights=has_opposite[has_lvl],
+                                    minlength=num_cells)
+        return num_opposites == num_edges
+
     def get_valid(self):
         """Set true if the face is a closed polygon
         """
-        is_valid_face = self.edge_df.groupby('face').apply(_test_valid)
-        is_valid = self.upcast_face(is_valid_face)
-        if 'cell' in self.data_names:
-            is_valid_cell = self.edge_df.groupby('cell').apply(
-                _is_closed_cell)
-            is_valid = is_valid | self.upcast_cell(is_valid_cell)
+        face_codes, face_idx = self._lvl_codes('face', live=True)
+        is_valid = _codes_to_edges(
+            self._valid_faces(face_codes, face_idx.size), face_codes)
+        if self._has_cell:
+            cell_codes, cell_idx = self._lvl_codes('cell', live=True)
+            is_valid |= _codes_to_edges(
+                self._closed_cells(cell_codes, cell_idx.size), cell_codes)
         self.edge_df['is_valid'] = is_valid
 
     def get_invalid(self):
         """Returns a mask over edge for invalid faces
         """
-        is_invalid_face = self.edge_df.groupby('face').apply(_test_invalid)
-        invalid_edges = self.upcast_face(is_invalid_face)
-        if 'cell' in self.data_names:
-            is_invalid_cell = 1 - self.edge_df.groupby('cell').apply(
-                _is_closed_cell)
-            invalid_edges = invalid_edges | self.upcast_cell(is_invalid_cell)
-        return invalid_edges
+        face_codes, face_idx = self._lvl_codes('face', live=True)
+        invalid_edges = ~_codes_to_edges(
+            self._valid_faces(face_codes, face_idx.size), face_codes)
+        if self._has_cell:
+            cell_codes, cell_idx = self._lvl_codes('cell', live=True)
+            invalid_edges |= ~_codes_to_edges(
+                self._closed_cells(cell_codes, cell_idx.size), cell_codes)
+        return pd.Series(invalid_edges, index=self.edge_df.index)
 
     def sanitize(self):
         """Removes invalid faces and associated vertices
@@ -550,25 +765,34 @@ class Epithelium:
         log.info('{} {} level elements will be removed'.format(len(fto_rm),
                                                                top_level))
 
-        edge_df_ = self.edge_df.set_index(
-            top_level,
-            append=True).swaplevel(0, 1).sort_index()
-        to_rm = np.concatenate([edge_df_.loc[c].index.values
-                                for c in fto_rm])
-        to_rm.sort()
-        self.edge_df = self.edge_df.drop(to_rm)
+        to_rm = np.isin(self.edge_df[top_level].to_numpy(), fto_rm)
+        self.edge_df = self.edge_df[~to_rm]
 
-        remaining_verts = np.unique(self.edge_df[['srce', 'trgt']])
-        self.vert_df = self.vert_df.loc[remaining_verts]
+        # the vertices order is kept, as they are renumbered
+        # in reset_index bellow
+        remaining_verts = pd.unique(
+            self.edge_df[['srce', 'trgt']].to_numpy().ravel())
+        self.vert_df = self.vert_df[
+            self.vert_df.index.isin(remaining_verts)]
         if top_level == 'face':
             self.face_df = self.face_df.drop(fto_rm)
         elif top_level == 'cell':
-            remaining_faces = np.unique(self.edge_df['face'])
-            self.face_df = self.face_df.loc[remaining_faces]
+            remaining_faces = pd.unique(self.edge_df['face'].to_numpy())
+            self.face_df = self.face_df[
+                self.face_df.index.isin(remaining_faces)]
             self.cell_df = self.cell_df.drop(fto_rm)
         self.reset_index()
         self.reset_topo()
 
+    def _edge_vert_pos(self):
+        """Returns the positions in `vert_df` of the
+        edges source and target vertices
+        """
+        return (_vert_positions(self.vert_df.index,
+                                self.edge_df['srce'].to_numpy()),
+                _vert_positions(self.vert_df.index,
+                                self.edge_df['trgt'].to_numpy()))
+
     def cut_out(self, bbox, coords=None):
         """Returns the index of edges with
         at least one vertex outside of the
@@ -584,24 +808,24 @@ class Epithelium:
         """
         if coords is None:
             coords = self.coords
-        outs = pd.DataFrame(index=self.edge_df.index,
-                            columns=coords)
-        for c, bounds in zip(coords, bbox):
-            out_vert_ = ((self.vert_df[c] < bounds[0]) |
-                         (self.vert_df[c] > bounds[1]))
-            outs[c] = (self.upcast_srce(out_vert_) |
-                       self.upcast_trgt(out_vert_))
-
-        edge_out = outs.sum(axis=1).astype(np.bool)
-        return self.edge_df[edge_out].index
+        srce, trgt = self._edge_vert_pos()
+        dim = min(len(coords), len(bbox))
+        bounds = np.asarray(bbox, dtype=float)[:dim]
+        xyz = self.vert_df[list(coords[:dim])].to_numpy()
+        out_vert = ((xyz < bounds[:, 0]) | (xyz > bounds[:, 1])).any(axis=1)
+        edge_out = out_vert[srce] | out_vert[trgt]
+        return self.edge_df.index[edge_out]
 
     def set_bbox(self, margin=1.):
         '''Sets the attribute `bbox` with pairs of values bellow
         and above the min and max of the vert coords, with a margin.
         '''
-        self.bbox = np.array([[self.vert_df[c].min() - margin,
-                               self.vert_df[c].max() + margin]
-                              for c in self.coords])
+        xyz = self._vert_xyz
+        if not xyz.shape[0]:
+            self.bbox = np.full((len(self.coords), 2), np.nan)
+            return
+        self.bbox = np.stack([np.nanmin(xyz, axis=0) - margin,
+                              np.nanmax(xyz, axis=0) + margin], axis=1)
 
     def reset_index(self):
 
@@ -619,7 +843,7 @@ class Epithelium:
         self.face_df.reset_index(drop=True, inplace=True)
         self.face_df.index.name = 'face'
 
-        if 'cell' in self.data_names:
+        if self._has_cell:
             new_cidx = pd.Series(np.arange(self.cell_df.shape[0]),
                                  index=self.cell_df.index)
             self.edge_df['cell'] = self.upcast_cell(new_cidx)
@@ -628,6 +852,7 @@ class Epithelium:
 
         self.edge_df.reset_index(drop=True, inplace=True)
         self.edge_df.index.name = 'edge'
+        self._reset_topo_cache()
 
     def triangular_mesh(self, coords):
         '''
@@ -652,14 +877,13 @@ class Epithelium:
            to a face center
         '''
 
-        vertices = np.concatenate((self.face_df[coords],
-                                   self.vert_df[coords]), axis=0)
+        vertices = np.concatenate((self.face_df[coords].to_numpy(),
+                                   self.vert_df[coords].to_numpy()), axis=0)
 
         # edge indices as (Nf + Nv) * 3 array
-        triangles = self.edge_df[['srce', 'trgt', 'face']].values
         # The src, trgt, face triangle is correctly oriented
         # both vert_idx cols are shifted by Nf
-        triangles[:, :2] += self.Nf
+        triangles = self.edge_idx_array + np.array([self.Nf, self.Nf, 0])
 
         face_mask = np.arange(self.Nf + self.Nv) < self.Nf
         return vertices, triangles, face_mask
@@ -673,8 +897,10 @@ class Epithelium:
         # - BC -#
         # This method only works on 3D-epithelium
         vertices = self.vert_df[coords]
-        faces = self.edge_df.groupby('face').apply(ordered_vert_idxs)
-        faces = faces.dropna()
+        face_idx, face_offsets, srces, is_closed = self._ordered_face_srces()
+        faces = pd.Series([srces[start:stop].tolist() for start, stop
+                           in zip(face_offsets[:-1], face_offsets[1:])],
+                          index=face_idx)[is_closed]
         if vertex_normals:
             normals = (self.edge_df.groupby('srce')[self.ncoords].mean() +
                        self.edge_df.groupby('trgt')[self.ncoords].mean()) / 2.
@@ -682,8 +908,51 @@ class Epithelium:
         return vertices.values, faces.values
 
     def validate_closed_cells(self):
-        is_closed = self.edge_df.groupby('cell').apply(_is_closed_cell)
-        return is_closed
+        cell_codes, cell_idx = self._lvl_codes('cell', live=True)
+        return pd.Series(self._closed_cells(cell_codes, cell_idx.size),
+                         index=cell_idx)
+
+
+def _factorize_lvl(values, lvl):
+    """Returns the int32 codes of `values` and the sorted
+    `pd.Index` of their unique labels, named `lvl`
+    """
+    codes, uniques = pd.factorize(values, sort=True)
+    return codes.astype(np.int32), pd.Index(uniques, name=lvl)
+
+
+def _codes_to_edges(is_ok, codes):
+    """Returns the per edge values of the bool array `is_ok`,
+    defined over the coded elements, False for a code of -1
+    """
+    return is_ok[codes] & (codes >= 0)
+
+
+def _vert_positions(index, labels):
+    """Returns the positions of `labels` in `index`, raising
+    a KeyError for missing labels, as `.loc` would.
+    """
+    labels = np.asarray(labels)
+    if (labels.dtype.kind in 'iu') and _is_positional(index):
+        pos = labels
+        missing = (labels < 0) | (labels >= index.size)
+    else:
+        pos = index.get_indexer(labels)
+        missing = pos < 0
+    if missing.any():
+        raise KeyError('{} not in index'.format(
+            list(pd.unique(labels[missing]))))
+    return pos
+
+
+def _is_positional(index):
+    """Returns True if `index` is equal to `np.arange(index.size)`
+    """
+    if isinstance(index, pd.RangeIndex):
+        return (index.start == 0) and (index.step == 1)
+    return (index.dtype.kind in 'iu' and index.size > 0 and
+            index.is_monotonic_increasing and index.is_unique and
+            (index[0] == 0) and (index[-1] == index.size - 1))
 
 
 def _ordered_edges(face_edges):
@@ -700,13 +969,73 @@ def _ordered_edges(face_edges):
     edges: list of 3 ints
         srce, trgt, face indices, ordered
     """
-    srces, trgts, faces = face_edges[['srce', 'trgt', 'face']].values.T
-    srce, trgt, face_ = srces[0], trgts[0], faces[0]
-    edges = [[srce, trgt, face_]]
-    for face_ in faces[1:]:
-        srce, trgt = trgt, trgts[srces == trgt][0]
-        edges.append([srce, trgt, face_])
-    return edges
+    srces = face_edges['srce'].to_numpy().astype(np.int64)
+    trgts = face_edges['trgt'].to_numpy().astype(np.int64)
+    if not srces.size:
+        raise IndexError('Empty face')
+    ordered = np.empty(srces.size, dtype=np.int64)
+    is_closed = _ordered_edges_nb(srces, trgts,
+                                  np.array([0, srces.size], dtype=np.int64),
+                                  ordered)
+    if not is_closed[0]:
+        raise IndexError('Face is not closed')
+    return [list(edge) for edge in zip(srces[ordered].tolist(),
+                                       trgts[ordered].tolist(),
+                                       face_edges['face'].tolist())]
+
+
+@njit(cache=True)
+def _ordered_edges_nb(srces, trgts, face_offsets, out_ordered):
+    """Orders the edges of each face, such that each edge's target is
+    the source of the next one.
+
+    Parameters
+    ----------
+    srces, trgts: (Ne,) int64 arrays
+        sources and targets of the edges, sorted by face
+    face_offsets: (Nf+1,) int64 array
+        the edges of the ith face span `face_offsets[i]:face_offsets[i+1]`
+    out_ordered: (Ne,) int64 array
+        filled with the ordered positions of the edges in `srces`,
+        the edges of faces which are not closed are left in their
+        original order
+
+    Returns
+    -------
+    is_closed: (Nf,) bool array
+        False for the faces whose edges could not be chained
+    """
+    num_faces = face_offsets.size - 1
+    is_closed = np.ones(num_faces, dtype=np.bool_)
+    for f in range(num_faces):
+        start, stop = face_offsets[f], face_offsets[f+1]
+        srce_pos = Dict.empty(key_type=types.int64, value_type=types.int64)
+        for i in range(start, stop):
+            if srces[i] not in srce_pos:
+                srce_pos[srces[i]] = i
+        i = start
+        out_ordered[start] = i
+        for j in range(start+1, stop):
+            if trgts[i] not in srce_pos:
+                is_closed[f] = False
+                out_ordered[start:stop] = np.arange(start, stop)
+                break
+            i = srce_pos[trgts[i]]
+            out_ordered[j] = i
+    return is_closed
+
+
+@njit(cache=True)
+def _lvl_sum_nb(codes, values, out):
+    """Adds each row of the (Ne, ncols) array `values` to the row
+    `codes[i]` of the (n_codes, ncols) array `out`, in place.
+    Rows with a negative code are skipped.
+    """
+    for i in range(codes.size):
+        if codes[i] < 0:
+            continue
+        for j in range(values.shape[1]):
+            out[codes[i], j] += values[i, j]
 
 
 def ordered_vert_idxs(face):
@@ -716,42 +1045,42 @@ def ordered_vert_idxs(face):
         return np.nan
 
 
-def _test_invalid(face):
-    """ Returns true iff the source and target sets of the faces polygon
-    are different
+@njit(parallel=True, cache=True)
+def _valid_faces_nb(srces, trgts, offsets):
+    """For each group of edges spanning `offsets[i]:offsets[i+1]`,
+    tests if the sources and targets sets are equal
     """
-    s1 = set(face['srce'])
-    s2 = set(face['trgt'])
-    return s1 != s2
-
-
-def _test_valid(face):
-    """ Returns true iff all sources are also targets for the faces polygon
-    """
-    s1 = set(face['srce'])
-    s2 = set(face['trgt'])
-    return s1 == s2
+    num_faces = offsets.size - 1
+    is_valid = np.zeros(num_faces, dtype=np.bool_)
+    for f in prange(num_faces):
+        face_srces = np.unique(srces[offsets[f]:offsets[f+1]])
+        face_trgts = np.unique(trgts[offsets[f]:offsets[f+1]])
+        if face_srces.size == face_trgts.size:
+            is_valid[f] = np.all(face_srces == face_trgts)
+    return is_valid
 
 
 def get_opposite(edge_df):
     """
-    Returns the indices opposite to the edges in `edge_df`
-    """
-    st_indexed = edge_df[['srce', 'trgt']].reset_index().set_index(
-        ['srce', 'trgt'], drop=False)
-    flipped = st_indexed.index.swaplevel(0, 1)
-    flipped.names = ['srce', 'trgt']
-
-    opposite = st_indexed.loc[flipped, 'edge'].values
-    opposite[np.isnan(opposite)] = -1
+    Returns the indices opposite to the edges in `edge_df`,
+    with -1 for the edges without an opposite.
 
-    return opposite.astype(np.int)
-
-
-def _is_closed_cell(e_df):
-    edges = e_df[['srce', 'trgt']]
-    for e, (srce, trgt) in edges.iterrows():
-        if (edges[(edges['srce'] == trgt) &
-                  (edges['trgt'] == srce)].index.size != 1):
-            return False
-    return True
+    Raises a ValueError if the same (srce, trgt) pair
+    appears more than once.
+    """
+    srces = edge_df['srce'].to_numpy().astype(np.int64)
+    trgts = edge_df['trgt'].to_numpy().astype(np.int64)
+    if not srces.size:
+        return np.zeros(0, dtype=np.int64)
+    # (srce, trgt) pairs packed in a single int64 key
+    num_verts = max(srces.max(), trgts.max()) + 1
+    keys = srces * num_verts + trgts
+    flipped = trgts * num_verts + srces
+
+    key_edges = dict(zip(keys.tolist(), edge_df.index.tolist()))
+    if len(key_edges) != keys.size:
+        raise ValueError('Some (srce, trgt) pairs are repeated')
+    opposite = np.fromiter((key_edges.get(key, -1)
+                            for key in flipped.tolist()),
+                           dtype=np.int64, count=flipped.size)
+    return opposite
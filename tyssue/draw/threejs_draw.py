@@ -1,6 +1,7 @@
 import numpy as np
+import pandas as pd
+from matplotlib.colors import to_rgb
 
-import matplotlib.colors as mpl_colors
 from ..config.draw import sheet_spec
 
 try:
@@ -11,38 +12,50 @@ except ImportError:
 
 
 def edge_lines(sheet, coords, **draw_specs):
+    """Returns the edges as a :class:`pythreejs.LineSegments` object,
+    with the positions and colors stored as float32 buffers.
 
+    The vertices color in `draw_specs['vert']['color']` can either be
+    a single matplotlib color or a (sheet.Nv, 3) or (sheet.Nv, 4) array
+    of RGB(A) values. The alpha channel is dropped.
+    """
     spec = sheet_spec()
     spec.update(**draw_specs)
 
-    up_srce = sheet.upcast_srce(sheet.vert_df[sheet.coords])
-    up_trgt = sheet.upcast_trgt(sheet.vert_df[sheet.coords])
+    vert_pos = pd.Series(np.arange(sheet.Nv), index=sheet.vert_df.index)
+    srce = sheet.upcast_srce(vert_pos).to_numpy()
+    trgt = sheet.upcast_trgt(vert_pos).to_numpy()
+    xyz = sheet.vert_df[sheet.coords].to_numpy(dtype=np.float32)
+    # interleaved (srce, trgt) pairs, one row per line vertex
+    vertices = np.empty((srce.size * 2, 3), dtype=np.float32)
+    vertices[0::2] = xyz[srce]
+    vertices[1::2] = xyz[trgt]
 
-    vertices = np.hstack([up_srce.values, up_trgt.values])
-    vertices = vertices.reshape(vertices.shape[0]*2, 3)
     colors = spec['vert']['color']
     if isinstance(colors, str):
-        colors = [colors for v in vertices]
+        colors = np.tile(np.array(to_rgb(colors), dtype=np.float32),
+                         (vertices.shape[0], 1))
     else:
         colors = np.asarray(colors)
         if (colors.shape == (sheet.Nv, 3)) or (colors.shape == (sheet.Nv, 4)):
-            sheet.vert_df['hex_c'] = [mpl_colors.rgb2hex(c)
-                                      for c in colors]
-            srce_c = sheet.upcast_srce(sheet.vert_df['hex_c'])
-            trgt_c = sheet.upcast_trgt(sheet.vert_df['hex_c'])
-            colors = np.vstack([srce_c.values,
-                                trgt_c.values]).T.reshape(vertices.shape[0])
-            colors = list(colors)
+            rgb = colors[:, :3].astype(np.float32)
+            colors = np.empty((vertices.shape[0], 3), dtype=np.float32)
+            colors[0::2] = rgb[srce]
+            colors[1::2] = rgb[trgt]
         else:
             raise ValueError
 
-    linesgeom = py3js.PlainGeometry(vertices=[list(v) for v in vertices],
-                                    colors=colors)
-    return py3js.Line(geometry=linesgeom,
-                      material=py3js.LineBasicMaterial(
-                          linewidth=spec['edge']['width'],
-                          vertexColors='VertexColors'),
-                      type='LinePieces')
+    # typed arrays are sent to the browser as binary buffers
+    linesgeom = py3js.BufferGeometry(
+        attributes={
+            'position': py3js.BufferAttribute(array=vertices,
+                                              normalized=False),
+            'color': py3js.BufferAttribute(array=colors,
+                                           normalized=False)})
+    return py3js.LineSegments(geometry=linesgeom,
+                              material=py3js.LineBasicMaterial(
+                                  linewidth=spec['edge']['width'],
+                                  vertexColors='VertexColors'))
 
 
 def view_3js(sheet, coords=['x', 'y', 'z'], **draw_specs):
@@ -54,7 +67,7 @@ def view_3js(sheet, coords=['x', 'y', 'z'], **draw_specs):
     -------
 
     renderer: a :class:`pythreejs.pythreejs.Renderer` instance
-    lines: a :class:`pythreejs.pythreejs.Line` object
+    lines: a :class:`pythreejs.pythreejs.LineSegments` object
 
     Example
     -------
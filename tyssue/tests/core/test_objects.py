@@ -39,6 +39,14 @@ def test_opposite():
     assert_array_equal(true_opp, opposites)
 
 
+def test_opposite_repeated_edges():
+    datasets, data_dicts = three_faces_sheet()
+    edge_df = pd.concat([datasets['edge'], datasets['edge'].iloc[:1]],
+                        ignore_index=True)
+    with raises(ValueError):
+        get_opposite(edge_df)
+
+
 def test_extra_indices():
 
     datasets = {}
@@ -235,6 +243,39 @@ def test_upcast():
     assert_array_equal(expected_res, eptm.upcast_cell(datasets['vert']))
 
 
+def test_upcast_dtypes():
+    datasets_2d, specs = three_faces_sheet(zaxis=True)
+    eptm = Epithelium('3faces_2D', datasets_2d, specs)
+    face_df = pd.DataFrame({
+        'f': np.linspace(0, 1, eptm.Nf),
+        'i': np.arange(eptm.Nf),
+        'b': np.arange(eptm.Nf) % 2 == 0,
+        'cat': pd.Categorical(['a', 'b', 'a']),
+        'nullable': pd.array([1, None, 3], dtype='Int64')},
+        index=eptm.face_df.index)
+
+    def reference(df, idx):
+        upcast = df.loc[idx]
+        upcast.index = eptm.edge_df.index
+        return upcast
+
+    idx = eptm.edge_df['face']
+    for cols in (['f'], ['i'], ['b'], ['cat'], ['nullable'],
+                 ['f', 'i'], ['f', 'b', 'cat']):
+        pd.testing.assert_frame_equal(eptm.upcast_face(face_df[cols]),
+                                      reference(face_df[cols], idx))
+    for col in face_df.columns:
+        pd.testing.assert_series_equal(eptm.upcast_face(face_df[col]),
+                                       reference(face_df[col], idx))
+
+    # non positional index, through `.loc`
+    shifted = face_df.set_index(face_df.index + 10)
+    pd.testing.assert_frame_equal(eptm._upcast(idx + 10, shifted),
+                                  reference(shifted, idx + 10))
+    pd.testing.assert_series_equal(eptm._upcast(idx + 10, shifted['f']),
+                                   reference(shifted['f'], idx + 10))
+
+
 def test_summation():
     datasets_2d, specs = three_faces_sheet(zaxis=True)
     datasets = extrude(datasets_2d)
@@ -264,6 +305,57 @@ def test_summation():
 
 
 
+def test_summation_dtypes():
+    datasets_2d, specs = three_faces_sheet(zaxis=True)
+    datasets = extrude(datasets_2d)
+    eptm = Epithelium('3faces_3D', datasets, specs)
+    ne = eptm.Ne
+    edge_df = pd.DataFrame({
+        'f': np.linspace(0, 1, ne),
+        'i': np.arange(ne),
+        'b': np.arange(ne) % 3 == 0,
+        'nullable': pd.array(np.arange(ne), dtype='Int64')},
+        index=eptm.edge_df.index)
+
+    for lvl in ('srce', 'face', 'cell'):
+        grouped = edge_df.groupby(eptm.edge_df[lvl])
+        for cols in (['f'], ['i'], ['b'], ['nullable'],
+                     ['f', 'i'], ['f', 'b', 'nullable']):
+            pd.testing.assert_frame_equal(eptm._lvl_sum(edge_df[cols], lvl),
+                                          grouped[cols].sum())
+        for col in edge_df.columns:
+            pd.testing.assert_series_equal(eptm._lvl_sum(edge_df[col], lvl),
+                                           grouped[col].sum())
+
+
+def test_update_num_faces():
+    datasets_2d, specs = three_faces_sheet(zaxis=True)
+    datasets = extrude(datasets_2d, method='translation')
+    eptm = Epithelium('3faces_3D', datasets, specs)
+    expected = eptm.edge_df.groupby('cell')['face'].nunique()
+    assert_array_equal(eptm.cell_df['num_faces'], expected)
+
+    # faces shared between cells, and a cell with fewer faces
+    eptm.edge_df.loc[eptm.edge_df['cell'] == 1, 'face'] = 0
+    eptm._reset_topo_cache()
+    eptm.update_num_faces()
+    expected = eptm.edge_df.groupby('cell')['face'].nunique()
+    assert_array_equal(eptm.cell_df['num_faces'], expected)
+    assert eptm.cell_df.loc[1, 'num_faces'] == 1
+
+
+def test_summation_length_mismatch():
+    datasets, specs = three_faces_sheet()
+    eptm = Epithelium('3faces_2D', datasets, specs)
+    eptm.sum_face(pd.Series(1, index=eptm.edge_df.index))
+    eptm.edge_df.drop(0, inplace=True)
+    with raises(ValueError):
+        eptm.sum_face(pd.Series(1, index=eptm.edge_df.index))
+    eptm.reset_topo()
+    assert_array_equal(
+        eptm.sum_face(pd.Series(1, index=eptm.edge_df.index)), [5, 6, 6])
+
+
 def test_orbits():
     datasets_2d, specs = three_faces_sheet(zaxis=True)
     datasets = extrude(datasets_2d)
@@ -768,3 +860,99 @@ def test_ordered_edges():
     ## testing the exception case in ordered_vert_idxs :
     res_invalid_face = ordered_vert_idxs(eptm.edge_df.loc[eptm.edge_df['face'] == 98765])
     assert np.isnan(res_invalid_face)
+
+
+def test_set_bbox():
+    datasets_2d, specs = three_faces_sheet()
+    datasets = extrude(datasets_2d, method='translation')
+    eptm = Epithelium('3faces_3D', datasets)
+    eptm.set_bbox(margin=1.)
+    expected = np.array([[eptm.vert_df[c].min() - 1.,
+                          eptm.vert_df[c].max() + 1.]
+                         for c in eptm.coords])
+    assert_array_equal(eptm.bbox, expected)
+
+    eptm.vert_df = eptm.vert_df.iloc[:0]
+    eptm.set_bbox()
+    assert eptm.bbox.shape == (3, 2)
+    assert np.isnan(eptm.bbox).all()
+
+
+def test_sanitize_after_inplace_edit():
+    datasets, specs = three_faces_sheet()
+    eptm = Epithelium('3faces_2D', datasets, specs)
+    assert not eptm.get_invalid().any()
+    # the topology queries don't clear the per step sums cache
+    eptm.sum_face(eptm.edge_df['srce'])
+    eptm.face_polygons(['x', 'y'])
+    eptm.cut_out([[-1, 1], [-1, 1]])
+    assert 'face' in eptm._lvl_codes_cache
+    # topology columns edited in place, without reset_topo
+    eptm.edge_df.loc[0, 'face'] = 1
+    assert eptm.get_invalid().sum() == 12
+    eptm.sanitize()
+    assert eptm.Nf == 1
+    assert not eptm.get_invalid().any()
+
+
+def test_validate_closed_cells():
+    datasets_2d, _ = three_faces_sheet()
+    datasets = extrude(datasets_2d, method='translation')
+    eptm = Epithelium('3faces_3D', datasets)
+    assert eptm.validate_closed_cells().all()
+
+    # large vertex labels, for which a packed cell * Nv**2 + ...
+    # int64 key would wrap, with Nv**2 == 2**64
+    shifted = eptm.copy(deep_copy=True)
+    shifted.edge_df[['srce', 'trgt']] += (
+        2**32 - 1 - shifted.edge_df[['srce', 'trgt']].max().max())
+    assert shifted.validate_closed_cells().all()
+
+    # dropped edge
+    open_cell = eptm.copy(deep_copy=True)
+    cell = open_cell.edge_df.loc[0, 'cell']
+    open_cell.edge_df = open_cell.edge_df.drop(0)
+    is_closed = open_cell.validate_closed_cells()
+    assert not is_closed[cell]
+    assert is_closed.drop(cell).all()
+
+    # duplicated edge
+    dbl_cell = eptm.copy(deep_copy=True)
+    dbl_cell.edge_df = pd.concat([dbl_cell.edge_df,
+                                  dbl_cell.edge_df.loc[[0]]],
+                                 ignore_index=True)
+    is_closed = dbl_cell.validate_closed_cells()
+    assert not is_closed[cell]
+    assert is_closed.drop(cell).all()
+
+
+def test_missing_vert():
+    datasets, specs = three_faces_sheet()
+    sheet = Epithelium('3faces_2D', datasets, specs)
+    sheet.vert_df = sheet.vert_df.drop(3)
+    with raises(KeyError):
+        sheet.face_polygons(['x', 'y'])
+    with raises(KeyError):
+        sheet.cut_out([[-10, 10], [-10, 10]], coords=['x', 'y'])
+
+
+def test_nan_lvl():
+    datasets, specs = three_faces_sheet()
+    eptm = Epithelium('3faces_2D', datasets, specs)
+    eptm.edge_df.loc[0, 'face'] = np.nan
+    eptm.reset_topo()
+    ones = pd.Series(1, index=eptm.edge_df.index)
+    expected = ones.groupby(eptm.edge_df['face']).sum()
+    assert_array_equal(eptm.sum_face(ones), expected)
+    assert_array_equal(eptm.face_df['num_sides'], [5, 6, 6])
+    invalid = eptm.get_invalid()
+    assert invalid[0]
+    assert_array_equal(invalid[eptm.edge_df['face'] == 0], True)
+    assert not invalid[eptm.edge_df['face'] > 0].any()
+
+    # the edge with a NaN face is not a face by itself
+    polys = eptm.face_polygons(['x', 'y'])
+    assert_array_equal(polys.index, [0, 1, 2])
+    assert [len(poly) for poly in polys] == [5, 6, 6]
+    _, faces = eptm.vertex_mesh(['x', 'y'], vertex_normals=False)
+    assert [len(face) for face in faces] == [5, 6, 6]
@@ -0,0 +1,42 @@
+from unittest import mock
+
+import numpy as np
+from numpy.testing import assert_array_equal
+
+from tyssue import Sheet
+from tyssue.draw import threejs_draw
+
+
+def get_buffers(sheet, **draw_specs):
+    """Runs `edge_lines` with a mocked pythreejs and returns
+    the arrays passed to the position and color buffers
+    """
+    py3js = mock.MagicMock()
+    with mock.patch.object(threejs_draw, 'py3js', py3js, create=True):
+        threejs_draw.edge_lines(sheet, sheet.coords, **draw_specs)
+    position, color = (kwargs['array'] for _, kwargs
+                       in py3js.BufferAttribute.call_args_list)
+    return position, color
+
+
+def test_edge_lines():
+    sheet = Sheet.planar_sheet_3d('sheet', 4, 4, 1, 1)
+    sheet.vert_df = sheet.vert_df.set_index(sheet.vert_df.index + 10)
+    sheet.edge_df[['srce', 'trgt']] += 10
+
+    colors = np.random.random((sheet.Nv, 4))
+    position, color = get_buffers(sheet, vert={'color': colors})
+    assert position.dtype == color.dtype == np.float32
+
+    srce_xyz = sheet.vert_df.loc[sheet.edge_df['srce'], sheet.coords]
+    trgt_xyz = sheet.vert_df.loc[sheet.edge_df['trgt'], sheet.coords]
+    assert_array_equal(position[0::2], srce_xyz.to_numpy(np.float32))
+    assert_array_equal(position[1::2], trgt_xyz.to_numpy(np.float32))
+
+    srce_pos = sheet.vert_df.index.get_indexer(sheet.edge_df['srce'])
+    trgt_pos = sheet.vert_df.index.get_indexer(sheet.edge_df['trgt'])
+    assert_array_equal(color[0::2], colors[srce_pos, :3].astype(np.float32))
+    assert_array_equal(color[1::2], colors[trgt_pos, :3].astype(np.float32))
+
+    _, color = get_buffers(sheet, vert={'color': '#ff0000'})
+    assert_array_equal(color, [[1., 0., 0.]] * (2 * sheet.Ne))
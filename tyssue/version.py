@@ -0,0 +1,10 @@
+
+# THIS FILE IS GENERATED FROM tyssue SETUP.PY
+#
+short_version = '0.0.2'
+version = '0.0.2'
+full_version = '0.0.2.dev0+69eea8d'
+git_revision = '69eea8d2f5e59f1620b0f6dc2c3a49658dac4f66'
+release = False
+if not release:
+    version = full_version